@@ -277,7 +277,8 @@ class MPICommunication(Communication):
         if is_contiguous:
             if counts is None:
                 return mpi_type, elements
-            factor = np.prod(obj.shape[1:])
+            # np.prod returns a float for empty shapes, but MPI requires integral counts
+            factor = int(np.prod(obj.shape[1:]))
             return (
                 mpi_type,
                 (
@@ -300,7 +301,11 @@ class MPICommunication(Communication):
             mpi_type.Commit()
 
         if counts is not None:
-            return mpi_type, (counts, displs)
+            # counts and displacements may arrive as torch tensors; MPI requires plain ints
+            return mpi_type, (
+                tuple(int(ele) for ele in counts),
+                tuple(int(ele) for ele in displs),
+            )
 
         return mpi_type, elements
 
@@ -2,6 +2,7 @@
 Functions relating to indices of items within DNDarrays, i.e. `where()`
 """
 
+import numpy as np
 import torch
 from typing import List, Dict, Any, TypeVar, Union, Tuple, Sequence
 
@@ -55,14 +56,20 @@ def nonzero(x: DNDarray) -> DNDarray:
 
     if x.split is None:
         # if there is no split then just return the values from torch
-        lcl_nonzero = torch.nonzero(input=x.larray, as_tuple=False)
+        if x.larray.ndim > 0 and x.larray.device.type == "cpu":
+            # on CPU, numpy's nonzero is considerably faster than the torch counterpart
+            lcl_nonzero = torch.from_numpy(np.stack(np.nonzero(x.larray.numpy()), axis=-1))
+        else:
+            lcl_nonzero = torch.nonzero(input=x.larray, as_tuple=False)
         gout = list(lcl_nonzero.size())
         is_split = None
     else:
         # a is split
         lcl_nonzero = torch.nonzero(input=x.larray, as_tuple=False)
         _, _, slices = x.comm.chunk(x.shape, x.split)
-        lcl_nonzero[..., x.split] += slices[x.split].start
+        # shift the local indices along the split dimension to their global positions, in-place
+        # on the column view to avoid the advanced-indexing temporary
+        lcl_nonzero[:, x.split].add_(slices[x.split].start)
         gout = list(lcl_nonzero.size())
         gout[0] = x.comm.allreduce(gout[0], MPI.SUM)
         is_split = 0
@@ -2425,6 +2425,19 @@ def shape(a: DNDarray) -> Tuple[int, ...]:
     return a.gshape
 
 
+def _counts_to_displs(counts: torch.Tensor) -> torch.Tensor:
+    """
+    Compute the displacements belonging to a vector of counts for v-type MPI calls, i.e. the
+    exclusive prefix sum of ``counts``, without converting through numpy or Python lists.
+
+    Parameters
+    ----------
+    counts : torch.Tensor
+        One-dimensional tensor of send or receive counts.
+    """
+    return torch.cat((counts.new_zeros(1), counts[:-1].cumsum(0)))
+
+
 def sort(a: DNDarray, axis: int = -1, descending: bool = False, out: Optional[DNDarray] = None):
     """
     Sorts the elements of `a` along the given dimension (by default in ascending order) by their value.
@@ -2467,8 +2480,9 @@ def sort(a: DNDarray, axis: int = -1, descending: bool = False, out: Optional[DN
     """
     stride_tricks.sanitize_axis(a.shape, axis)
 
-    if a.split is None or axis != a.split:
-        # sorting is not affected by split -> we can just sort along the axis
+    if a.split is None or axis != a.split or a.comm.Get_size() == 1:
+        # sorting is not affected by split (or there is only one process)
+        # -> we can just sort along the axis
         final_result, final_indices = torch.sort(a.larray, dim=axis, descending=descending)
 
     else:
@@ -2485,20 +2499,20 @@ def sort(a: DNDarray, axis: int = -1, descending: bool = False, out: Optional[DN
 
         length = local_sorted.size()[0]
 
-        # Separate the sorted tensor into size + 1 equal length partitions
-        partitions = [x * length // (size + 1) for x in range(1, size + 1)]
-        local_pivots = (
-            local_sorted[partitions]
-            if counts[rank]
-            else torch.empty((0,) + local_sorted.size()[1:], dtype=local_sorted.dtype)
-        )
+        # Regular sampling: every process contributes a small set of evenly spaced samples of its
+        # sorted data, keeping the gathered volume at O(p log p) instead of one sample per process.
+        # Processes with fewer elements than that contribute each element at most once, so empty
+        # processes simply contribute nothing instead of being special-cased
+        num_samples = max(16, int(np.log2(size)) + 1)
+        gather_counts = torch.tensor([min(num_samples, int(x)) for x in counts])
+        local_samples = int(gather_counts[rank])
+        partitions = [x * length // (local_samples + 1) for x in range(1, local_samples + 1)]
+        local_pivots = local_sorted[partitions]
 
-        # Only processes with elements should share their pivots
-        gather_counts = [int(x > 0) * size for x in counts]
-        gather_displs = (0,) + tuple(np.cumsum(gather_counts[:-1]))
+        gather_displs = _counts_to_displs(gather_counts)
 
         pivot_dim = list(transposed.size())
-        pivot_dim[0] = size * sum(x > 0 for x in counts)
+        pivot_dim[0] = int(gather_counts.sum())
 
         # share the local pivots with root process
         pivot_buffer = torch.empty(
@@ -2513,45 +2527,60 @@ def sort(a: DNDarray, axis: int = -1, descending: bool = False, out: Optional[DN
 
         # root process creates new pivots and shares them with other processes
         if rank == 0:
-            sorted_pivots, _ = torch.sort(pivot_buffer, descending=descending, dim=0)
-            length = sorted_pivots.size()[0]
-            global_partitions = [x * length // size for x in range(1, size)]
-            global_pivots = sorted_pivots[global_partitions]
+            candidates = pivot_buffer.shape[0]
+            global_partitions = torch.tensor(
+                [x * candidates // size for x in range(1, size)], dtype=torch.int64
+            )
+            if 0 < size - 1 < int(np.log2(max(candidates, 2))):
+                # only a handful of quantiles is needed, selecting them one by one is cheaper
+                # than fully sorting all candidates
+                global_pivots = torch.stack(
+                    [
+                        torch.kthvalue(
+                            pivot_buffer, candidates - int(k) if descending else int(k) + 1, dim=0
+                        ).values
+                        for k in global_partitions
+                    ]
+                )
+            else:
+                sorted_pivots, _ = torch.sort(pivot_buffer, descending=descending, dim=0)
+                global_pivots = sorted_pivots[global_partitions]
 
         a.comm.Bcast(global_pivots, root=0)
 
-        lt_partitions = torch.empty((size,) + local_sorted.shape, dtype=torch.int64)
-        last = torch.zeros_like(local_sorted, dtype=torch.int64)
-        comp_op = torch.gt if descending else torch.lt
-        # Iterate over all pivots and store which pivot is the first greater than the elements value
-        for idx, p in enumerate(global_pivots):
-            lt = comp_op(local_sorted, p).int()
-            if idx > 0:
-                lt_partitions[idx] = lt - last
-            else:
-                lt_partitions[idx] = lt
-            last = lt
-        lt_partitions[size - 1] = torch.ones_like(local_sorted, dtype=last.dtype) - last
+        local_length = local_sorted.shape[0]
+        trailing_length = int(np.prod(local_sorted.shape[1:]))
+
+        # Matrix that holds information which value will be shipped where; the destination of an
+        # element is the number of pivots it has already passed, computed as one vectorized binary
+        # search per column instead of comparing against every pivot in a Python loop
+        pivots = global_pivots.flip(0) if descending else global_pivots
+        flat_pivots = pivots.reshape(size - 1, trailing_length).t().contiguous()
+        flat_sorted = local_sorted.reshape(local_length, trailing_length).t().contiguous()
+        if descending:
+            flat_index = (size - 1) - torch.searchsorted(flat_pivots, flat_sorted)
+        else:
+            flat_index = torch.searchsorted(flat_pivots, flat_sorted, right=True)
+        index_matrix = flat_index.t().reshape(local_sorted.shape)
 
         # Matrix holding information how many values will be sent where
-        local_partitions = torch.sum(lt_partitions, dim=1)
+        local_partitions = torch.zeros(
+            (size,) + local_sorted.shape[1:], dtype=torch.int64, device=local_sorted.device
+        )
+        local_partitions.reshape(size, trailing_length).scatter_add_(
+            0,
+            index_matrix.reshape(local_length, trailing_length),
+            torch.ones(
+                (local_length, trailing_length), dtype=torch.int64, device=local_sorted.device
+            ),
+        )
 
         partition_matrix = torch.empty_like(local_partitions)
         a.comm.Allreduce(local_partitions, partition_matrix, op=MPI.SUM)
 
-        # Matrix that holds information which value will be shipped where
-        index_matrix = torch.empty_like(local_sorted, dtype=torch.int64)
-
         # Matrix holding information which process get how many values from where
-        shape = (size,) + transposed.size()[1:]
-        send_matrix = torch.zeros(shape, dtype=partition_matrix.dtype)
-        recv_matrix = torch.zeros(shape, dtype=partition_matrix.dtype)
-
-        for i, x in enumerate(lt_partitions):
-            index_matrix[x > 0] = i
-            send_matrix[i] += torch.sum(x, dim=0)
-
-        a.comm.Alltoall(send_matrix, recv_matrix)
+        recv_matrix = torch.zeros_like(local_partitions)
+        a.comm.Alltoall(local_partitions, recv_matrix)
 
         scounts = local_partitions
         rcounts = recv_matrix
@@ -2564,74 +2593,47 @@ def sort(a: DNDarray, axis: int = -1, descending: bool = False, out: Optional[DN
         for idx in np.ndindex(local_sorted.shape[1:]):
             idx_slice = [slice(None)] + [slice(ind, ind + 1) for ind in idx]
 
-            send_count = scounts[idx_slice].reshape(-1).tolist()
-            send_disp = [0] + list(np.cumsum(send_count[:-1]))
-            s_val = local_sorted[idx_slice].clone()
-            s_ind = actual_indices[idx_slice].clone().to(dtype=local_sorted.dtype)
-
-            recv_count = rcounts[idx_slice].reshape(-1).tolist()
-            recv_disp = [0] + list(np.cumsum(recv_count[:-1]))
-            rcv_length = rcounts[idx_slice].sum().item()
-            r_val = torch.empty((rcv_length,) + s_val.shape[1:], dtype=local_sorted.dtype)
-            r_ind = torch.empty_like(r_val)
-
-            a.comm.Alltoallv((s_val, send_count, send_disp), (r_val, recv_count, recv_disp))
-            a.comm.Alltoallv((s_ind, send_count, send_disp), (r_ind, recv_count, recv_disp))
-            first_result[idx_slice][:rcv_length] = r_val
-            first_indices[idx_slice][:rcv_length] = r_ind
-
-        # The process might not have the correct number of values therefore the tensors need to be rebalanced
-        send_vec = torch.zeros(local_sorted.shape[1:] + (size, size), dtype=torch.int64)
-        target_cumsum = np.cumsum(counts)
-        for idx in np.ndindex(local_sorted.shape[1:]):
-            idx_slice = [slice(None)] + [slice(ind, ind + 1) for ind in idx]
-            current_counts = partition_matrix[idx_slice].reshape(-1).tolist()
-            current_cumsum = list(np.cumsum(current_counts))
-            for proc in range(size):
-                if current_cumsum[proc] > target_cumsum[proc]:
-                    # process has to many values which will be sent to higher ranks
-                    first = next(i for i in range(size) if send_vec[idx][:, i].sum() < counts[i])
-                    last = next(
-                        i
-                        for i in range(size + 1)
-                        if i == size or current_cumsum[proc] < target_cumsum[i]
-                    )
-                    sent = 0
-                    for i, x in enumerate(counts[first:last]):
-                        # Each following process gets as many elements as it needs
-                        amount = int(x - send_vec[idx][:, first + i].sum())
-                        send_vec[idx][proc][first + i] = amount
-                        current_counts[first + i] += amount
-                        sent = send_vec[idx][proc][: first + i + 1].sum().item()
-                    if last < size:
-                        # Send all left over values to the highest last process
-                        amount = partition_matrix[proc][idx]
-                        send_vec[idx][proc][last] = int(amount - sent)
-                        current_counts[last] += int(amount - sent)
-                elif current_cumsum[proc] < target_cumsum[proc]:
-                    # process needs values from higher rank
-                    first = (
-                        0
-                        if proc == 0
-                        else next(
-                            i for i, x in enumerate(current_cumsum) if target_cumsum[proc - 1] < x
-                        )
-                    )
-                    last = next(i for i, x in enumerate(current_cumsum) if target_cumsum[proc] <= x)
-                    for i, x in enumerate(partition_matrix[idx_slice][first:last]):
-                        # Taking as many elements as possible from each following process
-                        send_vec[idx][first + i][proc] = int(x - send_vec[idx][first + i].sum())
-                        current_counts[first + i] = 0
-                    # Taking just enough elements from the last element to fill the current processes tensor
-                    send_vec[idx][last][proc] = int(target_cumsum[proc] - current_cumsum[last - 1])
-                    current_counts[last] -= int(target_cumsum[proc] - current_cumsum[last - 1])
-                else:
-                    # process doesn't need more values
-                    send_vec[idx][proc][proc] = (
-                        partition_matrix[proc][idx] - send_vec[idx][proc].sum()
-                    )
-                current_counts[proc] = counts[proc]
-                current_cumsum = list(np.cumsum(current_counts))
+            send_count = scounts[idx_slice].reshape(-1)
+            send_disp = _counts_to_displs(send_count)
+
+            recv_count = rcounts[idx_slice].reshape(-1)
+            recv_disp = _counts_to_displs(recv_count)
+            rcv_length = recv_count.sum().item()
+
+            # Pack values and their original indices into one buffer so a single collective
+            # moves both
+            s_buf = torch.stack(
+                (local_sorted[idx_slice], actual_indices[idx_slice].to(dtype=local_sorted.dtype)),
+                dim=-1,
+            )
+            r_buf = torch.empty((rcv_length,) + s_buf.shape[1:], dtype=local_sorted.dtype)
+
+            a.comm.Alltoallv((s_buf, send_count, send_disp), (r_buf, recv_count, recv_disp))
+            first_result[idx_slice][:rcv_length] = r_buf[..., 0]
+            first_indices[idx_slice][:rcv_length] = r_buf[..., 1]
+
+        # The process might not have the correct number of values therefore the tensors need to be
+        # rebalanced. In the globally sorted order process p currently holds the contiguous chunk
+        # of positions [current_cumsum[p - 1], current_cumsum[p]) and has to end up with
+        # [target_cumsum[p - 1], target_cumsum[p]), so the amount process p sends to process q is
+        # exactly the overlap of the two intervals; no iterative fix-up is required.
+        current_cumsum = torch.cat(
+            (
+                torch.zeros((1, trailing_length), dtype=torch.int64, device=local_sorted.device),
+                partition_matrix.reshape(size, trailing_length).cumsum(0),
+            )
+        )
+        target_cumsum = torch.cat(
+            (
+                torch.zeros(1, dtype=torch.int64, device=local_sorted.device),
+                torch.tensor(counts, dtype=torch.int64, device=local_sorted.device).cumsum(0),
+            )
+        )
+        send_vec = torch.minimum(
+            current_cumsum[1:, None, :], target_cumsum[None, 1:, None]
+        ) - torch.maximum(current_cumsum[:-1, None, :], target_cumsum[None, :-1, None])
+        send_vec = send_vec.clamp_(min=0).permute(2, 0, 1)
+        send_vec = send_vec.reshape(local_sorted.shape[1:] + (size, size))
 
         # Iterate through one layer again to create the final balanced local tensors
         second_result = torch.empty_like(local_sorted)
@@ -2640,32 +2642,28 @@ def sort(a: DNDarray, axis: int = -1, descending: bool = False, out: Optional[DN
             idx_slice = [slice(None)] + [slice(ind, ind + 1) for ind in idx]
 
             send_count = send_vec[idx][rank]
-            send_disp = [0] + list(np.cumsum(send_count[:-1]))
+            send_disp = _counts_to_displs(send_count)
 
             recv_count = send_vec[idx][:, rank]
-            recv_disp = [0] + list(np.cumsum(recv_count[:-1]))
+            recv_disp = _counts_to_displs(recv_count)
 
             end = partition_matrix[rank][idx]
             s_val, indices = first_result[0:end][idx_slice].sort(descending=descending, dim=0)
             s_ind = first_indices[0:end][idx_slice][indices].reshape_as(s_val)
 
-            r_val = torch.empty((counts[rank],) + s_val.shape[1:], dtype=local_sorted.dtype)
-            r_ind = torch.empty_like(r_val)
+            # Again, one packed collective replaces separate value and index exchanges
+            s_buf = torch.stack((s_val, s_ind), dim=-1)
+            r_buf = torch.empty((counts[rank],) + s_buf.shape[1:], dtype=local_sorted.dtype)
 
-            a.comm.Alltoallv((s_val, send_count, send_disp), (r_val, recv_count, recv_disp))
-            a.comm.Alltoallv((s_ind, send_count, send_disp), (r_ind, recv_count, recv_disp))
+            a.comm.Alltoallv((s_buf, send_count, send_disp), (r_buf, recv_count, recv_disp))
 
-            second_result[idx_slice] = r_val
-            second_indices[idx_slice] = r_ind
+            second_result[idx_slice] = r_buf[..., 0]
+            second_indices[idx_slice] = r_buf[..., 1]
 
         second_result, tmp_indices = second_result.sort(dim=0, descending=descending)
         final_result = second_result.transpose(0, axis)
-        final_indices = torch.empty_like(second_indices)
         # Update the indices in case the ordering changed during the last sort
-        for idx in np.ndindex(tmp_indices.shape):
-            val = tmp_indices[idx]
-            final_indices[idx] = second_indices[val.item()][idx[1:]]
-        final_indices = final_indices.transpose(0, axis)
+        final_indices = torch.gather(second_indices, 0, tmp_indices).transpose(0, axis)
     return_indices = factories.array(
         final_indices, dtype=types.int32, is_split=a.split, device=a.device, comm=a.comm
     )
@@ -3285,25 +3283,73 @@ def unique(
         is_split = None
         split = a.split
 
-        output_dim = list(lres.shape)
-        output_dim[0] = uniques_buf.sum().item()
+        if a.comm.Get_size() == 1:
+            # a single process already holds the global result, no communication and no second
+            # unique pass are needed
+            gres = lres
+            if return_inverse:
+                inverse_indices = inverse_pos
+        elif not return_inverse:
+            # No inverse mapping is requested, so the local unique vectors do not have to be
+            # gathered everywhere: merge them up a binomial tree instead. Every round pairs of
+            # processes combine their partial results with a single unique over the
+            # concatenation, so each process only ever holds two partial results at a time
+            # instead of the uniques of all processes.
+            nprocs = a.comm.Get_size()
+            rank = a.comm.Get_rank()
+            step = 1
+            while step < nprocs:
+                if rank % (2 * step) == step:
+                    partner = rank - step
+                    a.comm.Send(torch.tensor([lres.shape[0]], dtype=torch.int64), dest=partner)
+                    a.comm.Send(lres.contiguous(), dest=partner)
+                elif rank % (2 * step) == 0 and rank + step < nprocs:
+                    partner = rank + step
+                    recv_amount = torch.empty(1, dtype=torch.int64)
+                    a.comm.Recv(recv_amount, source=partner)
+                    recv_shape = list(lres.shape)
+                    recv_shape[0] = recv_amount.item()
+                    recv_uniques = torch.empty(
+                        recv_shape, dtype=a.dtype.torch_type(), device=a.device.torch_device
+                    )
+                    a.comm.Recv(recv_uniques, source=partner)
+                    lres = torch.unique(
+                        torch.cat((lres, recv_uniques), dim=0), sorted=sorted, dim=unique_axis
+                    )
+                step *= 2
+
+            # the fully merged result lives on process 0, share it with everyone
+            total_uniques = torch.tensor([lres.shape[0]], dtype=torch.int64)
+            a.comm.Bcast(total_uniques, root=0)
+            gres = lres.contiguous()
+            if rank != 0:
+                gres_shape = list(lres.shape)
+                gres_shape[0] = total_uniques.item()
+                gres = torch.empty(
+                    gres_shape, dtype=a.dtype.torch_type(), device=a.device.torch_device
+                )
+            a.comm.Bcast(gres, root=0)
 
-        # Gather all unique vectors
-        counts = list(uniques_buf.tolist())
-        displs = list([0] + uniques_buf.cumsum(0).tolist()[:-1])
-        gres_buf = torch.empty(output_dim, dtype=a.dtype.torch_type(), device=a.device.torch_device)
-        a.comm.Allgatherv(lres, (gres_buf, counts, displs), recv_axis=0)
+        else:
+            output_dim = list(lres.shape)
+            output_dim[0] = uniques_buf.sum().item()
+
+            # Gather all unique vectors
+            counts = uniques_buf
+            displs = _counts_to_displs(uniques_buf)
+            gres_buf = torch.empty(
+                output_dim, dtype=a.dtype.torch_type(), device=a.device.torch_device
+            )
+            a.comm.Allgatherv(lres, (gres_buf, counts, displs), recv_axis=0)
 
-        if return_inverse:
             # Prepare some information to generated the inverse indices list
             avg_len = a.gshape[a.split] // a.comm.Get_size()
             rem = a.gshape[a.split] % a.comm.Get_size()
 
             # Share the local reverse indices with other processes
-            counts = [avg_len] * a.comm.Get_size()
-            add_vec = [1] * rem + [0] * (a.comm.Get_size() - rem)
-            inverse_counts = [sum(x) for x in zip(counts, add_vec)]
-            inverse_displs = [0] + list(np.cumsum(inverse_counts[:-1]))
+            inverse_counts = torch.full((a.comm.Get_size(),), avg_len, dtype=torch.int64)
+            inverse_counts[:rem] += 1
+            inverse_displs = _counts_to_displs(inverse_counts)
             inverse_dim = list(inverse_pos.shape)
             inverse_dim[a.split] = a.gshape[a.split]
             inverse_buf = torch.empty(inverse_dim, dtype=inverse_pos.dtype)
@@ -3316,12 +3362,11 @@ def unique(
             )
             inverse_buf = inverse_buf.transpose(0, a.split)
 
-        # Run unique a second time
-        gres = torch.unique(gres_buf, sorted=sorted, return_inverse=return_inverse, dim=unique_axis)
-        if return_inverse:
+            # Run unique a second time
+            gres, g_inverse = torch.unique(
+                gres_buf, sorted=sorted, return_inverse=True, dim=unique_axis
+            )
             # Use the previously gathered information to generate global inverse_indices
-            g_inverse = gres[1]
-            gres = gres[0]
             if axis is None:
                 # Calculate how many elements we have in each layer along the split axis
                 elements_per_layer = 1
@@ -3329,39 +3374,34 @@ def unique(
                     if not num == a.split:
                         elements_per_layer *= val
 
-                # Create the displacements for the flattened inverse indices array
-                local_elements = [displ * elements_per_layer for displ in inverse_displs][1:] + [
-                    float("inf")
-                ]
+                # Boundaries between the processes' segments of the flattened inverse indices array
+                segment_ends = inverse_displs[1:] * elements_per_layer
 
                 # Flatten the inverse indices array every element can be updated to represent a global index
                 transposed = inverse_buf.transpose(0, a.split)
                 transposed_shape = transposed.shape
                 flatten_inverse = transposed.flatten()
 
-                # Update the index elements iteratively
-                cur_displ = 0
-                inverse_indices = [0] * len(flatten_inverse)
-                for num in range(len(inverse_indices)):
-                    if num >= local_elements[cur_displ]:
-                        cur_displ += 1
-                    index = flatten_inverse[num] + displs[cur_displ]
-                    inverse_indices[num] = g_inverse[index].tolist()
+                # Shift every element by the unique-displacement of the process it came from and
+                # resolve it in the global inverse, all in vectorized torch ops
+                positions = torch.arange(flatten_inverse.shape[0])
+                origin = torch.bucketize(positions, segment_ends, right=True)
+                offsets = displs.to(torch.int64)[origin]
 
                 # Convert the flattened array back to the correct global shape of a
-                inverse_indices = torch.tensor(inverse_indices).reshape(transposed_shape)
+                inverse_indices = g_inverse[flatten_inverse + offsets].reshape(transposed_shape)
                 inverse_indices = inverse_indices.transpose(0, a.split)
 
             else:
                 inverse_indices = torch.zeros_like(inverse_buf)
-                steps = displs + [None]
+                steps = displs.tolist() + [None]
 
-                # Algorithm that creates the correct list for the reverse_indices
+                # Map each process' segment of local inverse positions onto the global unique
+                # positions in one vectorized lookup per segment
                 for i in range(len(steps) - 1):
                     begin = steps[i]
                     end = steps[i + 1]
-                    for num, x in enumerate(inverse_buf[begin:end]):
-                        inverse_indices[begin + num] = g_inverse[begin + x]
+                    inverse_indices[begin:end] = g_inverse[begin + inverse_buf[begin:end]]
 
     else:
         # Tensor is already split and does not need to be redistributed afterward